@@ -1,5 +0,0 @@
-# Controllers module for handling template rendering and view logic
-from app.controllers.auth_controller import AuthController
-from app.controllers.main_controller import MainController
-
-__all__ = ['MainController', 'AuthController']
@@ -1,15 +0,0 @@
-from flask_cors import CORS  # type: ignore[import-untyped]
-from flask_jwt_extended import JWTManager
-from flask_migrate import Migrate  # type: ignore[import-untyped]
-from flask_sqlalchemy import SQLAlchemy
-
-db = SQLAlchemy()
-migrate = Migrate()
-jwt = JWTManager()
-cors = CORS()
-
-def init_extensions(app):
-    db.init_app(app)
-    migrate.init_app(app, db)
-    jwt.init_app(app)
-    cors.init_app(app)
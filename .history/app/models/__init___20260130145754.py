@@ -1 +0,0 @@
-from app.models.user import User  # noqa: F401
@@ -1,16 +1,32 @@
+from functools import lru_cache
+
 from flask import Flask, render_template
+from werkzeug.utils import import_string
 
-from app.core.config import config
+from app.core.config import DEFAULT_CONFIG, config
 from app.core.extensions import init_extensions
+from app.utils.lazy import LazyView
+
+# (rule, endpoint, view import path, options) - views are imported on first request.
+# Must mirror the routes of the main/api/auth blueprints, which declare views only;
+# tests/integration/test_routes.py fails if either side drifts.
+URL_RULES = [
+    ('/', 'main.index', 'app.routes.main.index', {}),
+    ('/health', 'main.health', 'app.routes.main.health', {}),
+    ('/api/v1/items', 'api.get_items', 'app.routes.api.get_items', {}),
+    ('/auth/login', 'auth.login', 'app.routes.auth.login', {'methods': ['POST']}),
+]
+
+# (blueprint import path, url_prefix, config flag that enables it)
+BLUEPRINTS = [
+    ('app.routes.swagger.swagger_bp', '/api', 'ENABLE_SWAGGER'),  # Swagger UI at /api/docs
+]
 
 
 def create_app(config_name='development'):
     app = Flask(__name__)
 
-    if config_name not in config:
-        config_name = 'default'
-
-    app.config.from_object(config[config_name])
+    app.config.update(_resolve_config(config_name))
     init_extensions(app)
 
     # Register error handlers
@@ -22,13 +38,29 @@ def create_app(config_name='development'):
     def internal_error(error):
         return render_template('errors/500.html'), 500
 
-    # Register Blueprints
-    from app.routes import api, auth, main
-    from app.routes.swagger import swagger_bp
-
-    app.register_blueprint(main.bp)
-    app.register_blueprint(api.bp, url_prefix='/api/v1')
-    app.register_blueprint(auth.bp, url_prefix='/auth')
-    app.register_blueprint(swagger_bp, url_prefix='/api')  # Swagger UI at /api/docs
+    if app.config.get('REGISTER_BLUEPRINTS', True):
+        register_views(app)
 
     return app
+
+
+@lru_cache(maxsize=None)
+def _resolve_config(config_name):
+    # Same settings app.config.from_object() would collect, scanned once per name
+    obj = config.get(config_name, DEFAULT_CONFIG)
+    return {key: getattr(obj, key) for key in dir(obj) if key.isupper()}
+
+
+def register_views(app):
+    for rule, endpoint, import_name, options in URL_RULES:
+        app.add_url_rule(rule, endpoint, view_func=LazyView(import_name), **options)
+
+    for import_name, url_prefix, flag in BLUEPRINTS:
+        if app.config[flag]:
+            app.register_blueprint(_load_blueprint(import_name), url_prefix=url_prefix)
+
+
+@lru_cache(maxsize=None)
+def _load_blueprint(import_name):
+    # Resolved once per process; later apps reuse the same Blueprint object
+    return import_string(import_name)
@@ -1,5 +1,8 @@
 import os
 from datetime import timedelta
+from types import MappingProxyType
+
+from sqlalchemy.pool import StaticPool
 
 
 class Config:
@@ -8,6 +11,7 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', SECRET_KEY)
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
+    ENABLE_SWAGGER = True
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -18,11 +22,23 @@ class ProductionConfig(Config):
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # An in-memory SQLite database lives only as long as its connection, so share one.
+    # Returning that shared connection to the pool must not roll it back, or the
+    # outer transaction a test runs in (see tests/conftest.py) would be discarded.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'pool_reset_on_return': None,
+        'connect_args': {'check_same_thread': False},
+    }
     WTF_CSRF_ENABLED = False
+    ENABLE_SWAGGER = False  # skip importing the Swagger blueprint in tests
+
+DEFAULT_CONFIG = DevelopmentConfig
 
-config = {
+# Read-only: built once at import time and shared by every create_app call
+config = MappingProxyType({
     'development': DevelopmentConfig,
     'production': ProductionConfig,
     'testing': TestingConfig,
-    'default': DevelopmentConfig
-}
+    'default': DEFAULT_CONFIG
+})
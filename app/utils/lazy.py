@@ -0,0 +1,21 @@
+from functools import cached_property
+
+from werkzeug.utils import import_string
+
+
+class LazyView:
+    """View function proxy that imports the real view on first request.
+
+    See https://flask.palletsprojects.com/en/stable/patterns/lazyloading/
+    """
+
+    def __init__(self, import_name):
+        self.__module__, self.__name__ = import_name.rsplit('.', 1)
+        self.import_name = import_name
+
+    @cached_property
+    def view(self):
+        return import_string(self.import_name)
+
+    def __call__(self, *args, **kwargs):
+        return self.view(*args, **kwargs)
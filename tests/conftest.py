@@ -1,18 +1,121 @@
+from functools import partial
+
 import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import scoped_session, sessionmaker
+from werkzeug.security import generate_password_hash
+
 from app import create_app
 from app.core.extensions import db
+from app.models.user import User
 
-@pytest.fixture
+# Tests only check hash round-trips; one pbkdf2 iteration keeps set_password cheap
+TEST_PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1'
+
+
+@pytest.fixture(scope='session')
 def app():
     # 'testing' config must exist in app/core/config.py
     app = create_app('testing')
 
+    # Schema is built once per test session; db_session isolates each test
     with app.app_context():
+        _enable_sqlite_savepoints(db.engine)
         db.create_all()
-        yield app
+
+    yield app
+
+    with app.app_context():
         db.session.remove()
-        db.drop_all()
+        # An in-memory database disappears with its connection; dropping is wasted work
+        if db.engine.url.database != ':memory:':
+            db.drop_all()
+        # Close pooled connections now instead of whenever the app is collected
+        for engine in db.engines.values():
+            engine.dispose()
+
+@pytest.fixture
+def app_ctx(app):
+    """Application context pushed for a single test and popped afterwards."""
+    with app.app_context() as ctx:
+        yield ctx
+
+@pytest.fixture(scope='session', autouse=True)
+def fast_password_hashing():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            'app.models.user.generate_password_hash',
+            partial(generate_password_hash, method=TEST_PASSWORD_HASH_METHOD),
+        )
+        yield
+
+@pytest.fixture
+def db_session(app_ctx):
+    """Session bound to an outer transaction that is rolled back after the test.
+
+    Commits inside the test only release a SAVEPOINT, so nothing a test writes
+    is visible to the next one. Use db_session.connection() rather than
+    db.engine for raw connection work inside a test.
+    """
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    session = scoped_session(sessionmaker(
+        bind=connection, join_transaction_mode='create_savepoint'
+    ))
+    app_session, db.session = db.session, session
+
+    yield session
+
+    session.remove()
+    db.session = app_session
+    outer_transaction_active = transaction.is_active
+    transaction.rollback()
+    connection.close()
+    assert outer_transaction_active, 'outer test transaction ended before teardown'
+
+@pytest.fixture(scope='session')
+def password_hash():
+    """Hash of 'password123', computed once and reused for factory-made users."""
+    return generate_password_hash('password123', method=TEST_PASSWORD_HASH_METHOD)
+
+@pytest.fixture
+def users_factory(db_session, password_hash):
+    """Insert user rows with a single INSERT and one commit.
+
+    Rows are dicts of User columns; password_hash defaults to the shared hash.
+    """
+    def create(rows):
+        rows = [{'password_hash': password_hash, **row} for row in rows]
+        db_session.execute(insert(User), rows)
+        db_session.commit()
+        return rows
+
+    return create
 
 @pytest.fixture
 def client(app):
     return app.test_client()
+
+
+def _enable_sqlite_savepoints(engine):
+    # pysqlite's implicit transaction handling lets RELEASE SAVEPOINT commit the
+    # outer transaction; emit BEGIN ourselves so rollbacks in db_session hold.
+    # https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#serializable-isolation-savepoints-transactional-ddl
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def do_begin(conn):
+        # StaticPool hands every checkout the same DBAPI connection. A second
+        # checkout while db_session holds it must not touch that connection:
+        # a failed BEGIN would roll back the test's outer transaction.
+        if conn.connection.dbapi_connection.in_transaction:
+            raise RuntimeError(
+                'db.engine was checked out inside a db_session test; '
+                'use db_session.connection() instead'
+            )
+        conn.exec_driver_sql('BEGIN')
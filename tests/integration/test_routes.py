@@ -1,3 +1,29 @@
+from flask import Blueprint, Flask
+from werkzeug.utils import import_string
+
+# Blueprints whose views create_app registers one by one through LazyView
+# (see URL_RULES in app/__init__.py), with the url_prefix each was mounted at
+LAZY_BLUEPRINTS = [
+    ('app.routes.main.bp', None),
+    ('app.routes.api.bp', '/api/v1'),
+    ('app.routes.auth.bp', '/auth'),
+]
+
+# Blueprint state that is lost when only its view functions are registered
+BLUEPRINT_HOOKS = [
+    'before_request_funcs', 'after_request_funcs', 'teardown_request_funcs',
+    'error_handler_spec', 'url_value_preprocessors', 'url_default_functions',
+    'template_context_processors',
+]
+
+
+def _rules(flask_app):
+    return {
+        (rule.rule, rule.endpoint, frozenset(rule.methods))
+        for rule in flask_app.url_map.iter_rules()
+        if rule.endpoint != 'static'
+    }
+
 def test_index(client):
     response = client.get('/')
     assert response.status_code == 200
@@ -6,3 +32,26 @@ def test_health(client):
     response = client.get('/health')
     assert response.status_code == 200
     assert response.json['status'] == 'healthy'
+
+def test_url_rules_match_blueprints(app):
+    # Mounting the real blueprints must give exactly the routes URL_RULES registers
+    reference = Flask(__name__)
+    for import_name, url_prefix in LAZY_BLUEPRINTS:
+        reference.register_blueprint(import_string(import_name), url_prefix=url_prefix)
+
+    assert _rules(app) == _rules(reference)
+
+def test_lazy_blueprints_only_declare_views():
+    # Hooks, error handlers, folders or app-level callbacks need register_blueprint
+    empty = Blueprint('empty', __name__)
+    for import_name, url_prefix in LAZY_BLUEPRINTS:
+        bp = import_string(import_name)
+        mounted = Flask(__name__)
+        mounted.register_blueprint(bp, url_prefix=url_prefix)
+
+        for hook in BLUEPRINT_HOOKS:
+            assert getattr(bp, hook) == getattr(empty, hook), f'{import_name}.{hook}'
+        assert bp.static_folder is None and bp.template_folder is None, import_name
+        assert not bp._blueprints and not bp.cli.commands, import_name
+        # Every deferred registration must be a route, not e.g. before_app_request
+        assert len(bp.deferred_functions) == len(_rules(mounted)), import_name
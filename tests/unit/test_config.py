@@ -0,0 +1,29 @@
+"""Application config resolution tests."""
+
+from app import create_app
+from app.core.config import DevelopmentConfig, TestingConfig
+
+
+class TestConfigResolution:
+    """Tests for selecting the config class in create_app."""
+
+    def test_named_config_applied(self):
+        """Test that a known config name loads that config class."""
+        app = create_app('testing')
+
+        assert app.config['TESTING'] is True
+        assert app.config['SQLALCHEMY_DATABASE_URI'] == TestingConfig.SQLALCHEMY_DATABASE_URI
+
+    def test_unknown_config_falls_back_to_default(self):
+        """Test that an unknown config name loads the default config."""
+        app = create_app('does-not-exist')
+
+        assert app.config['DEBUG'] is DevelopmentConfig.DEBUG
+        assert app.config['SQLALCHEMY_DATABASE_URI'] == DevelopmentConfig.SQLALCHEMY_DATABASE_URI
+
+    def test_swagger_disabled_for_testing(self):
+        """Test that the testing config does not register the Swagger blueprint."""
+        app = create_app('testing')
+
+        assert app.config['ENABLE_SWAGGER'] is False
+        assert 'swagger' not in app.blueprints
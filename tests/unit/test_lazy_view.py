@@ -0,0 +1,28 @@
+"""LazyView tests."""
+
+import sys
+
+from app.utils.lazy import LazyView
+
+
+class TestLazyView:
+    """Tests for deferred view imports."""
+
+    def test_view_not_imported_on_creation(self, monkeypatch):
+        """Test that creating a LazyView does not import its module."""
+        monkeypatch.delitem(sys.modules, 'app.routes.main', raising=False)
+
+        view = LazyView('app.routes.main.health')
+
+        assert view.__module__ == 'app.routes.main'
+        assert view.__name__ == 'health'
+        assert 'app.routes.main' not in sys.modules
+
+    def test_view_imported_on_first_call(self, app):
+        """Test that calling a LazyView dispatches to the real view."""
+        view = LazyView('app.routes.main.health')
+
+        with app.test_request_context('/health'):
+            assert view() == ({'status': 'healthy'}, 200)
+
+        assert 'app.routes.main' in sys.modules